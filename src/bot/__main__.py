@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Callable
 
 import discord
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from discord.ext import commands
 
 from bot import constants
@@ -27,7 +27,20 @@ def get_prefix(bot_: Bot, message_: discord.Message) -> Callable[[Bot, discord.M
 
 async def main() -> None:
     """Run the bot."""
-    async with ClientSession(headers={"Content-Type": "application/json"}, timeout=ClientTimeout(total=30)) as session:
+    # A single pooled session is shared by the bot and the Dragonfly client so that keep-alive connections
+    # are reused across scan loop iterations and commands instead of paying a TCP+TLS handshake per request.
+    connector = TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    async with ClientSession(
+        connector=connector,
+        headers={"Content-Type": "application/json"},
+        timeout=ClientTimeout(total=30),
+    ) as session:
         dragonfly_services = DragonflyServices(
             session=session,
             base_url=constants.Dragonfly.base_url,
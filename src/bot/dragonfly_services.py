@@ -1,13 +1,27 @@
 """Interacting with the Dragonfly API."""
 
+import asyncio
 import dataclasses
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any, Self
+from http import HTTPStatus
+from typing import Any, NamedTuple, Self
 
-from aiohttp import ClientSession
-from pydantic import BaseModel
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from pydantic import BaseModel, Field, TypeAdapter
+
+from bot.utils.caching import TTLCache
+
+# Matches the connector's `limit_per_host` so requests queue here rather than in aiohttp's connection pool
+MAX_CONCURRENT_REQUESTS = 16
+
+RETRY_BACKOFF = 0.5
+
+PACKAGE_CACHE_SIZE = 64
+PACKAGE_CACHE_TTL = 5 * 60
 
 
 class ScanStatus(Enum):
@@ -28,8 +42,8 @@ class Package(BaseModel):
     status: ScanStatus | None
     score: int | None
     inspector_url: str | None
-    rules: list[str] = []
-    download_urls: list[str] = []
+    rules: list[str] = Field(default_factory=list)
+    download_urls: list[str] = Field(default_factory=list)
     queued_at: datetime | None
     queued_by: str | None
     reported_at: datetime | None
@@ -45,6 +59,18 @@ class Package(BaseModel):
         return f"{self.name} {self.version}"
 
 
+# Validates package listings straight from the response body, without decoding them into dicts first
+_PACKAGE_LIST_ADAPTER = TypeAdapter(list[Package])
+
+
+class _CachedPackages(NamedTuple):
+    """A package listing along with the validators needed to revalidate it."""
+
+    packages: list[Package]
+    etag: str | None
+    last_modified: str | None
+
+
 @dataclass
 class PackageReport:
     """Represents the payload sent to the report endpoint."""
@@ -82,42 +108,62 @@ class DragonflyServices:
         self.password = password
         self.token = ""
         self.token_expires_at = datetime.now(tz=UTC)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._token_lock = asyncio.Lock()
+        self._package_cache: TTLCache[tuple[tuple[str, Any], ...], _CachedPackages] = TTLCache(
+            maxsize=PACKAGE_CACHE_SIZE,
+            ttl=PACKAGE_CACHE_TTL,
+        )
 
-    async def _update_token(self: Self) -> None:
-        """Update the OAUTH token."""
+    async def _update_token(self: Self, *, timeout: ClientTimeout | None = None) -> None:
+        """Update the OAUTH token. `timeout` overrides the session's default timeout."""
         if self.token_expires_at > datetime.now(tz=UTC):
             return
 
-        auth_dict = {
-            "grant_type": "password",
-            "audience": self.audience,
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "username": self.username,
-            "password": self.password,
-        }
-        async with self.session.post(self.auth_url, json=auth_dict) as response:
-            response.raise_for_status()
-            data = await response.json()
-            self.token = data["access_token"]
-            self.token_expires_at = datetime.now(tz=UTC) + timedelta(seconds=data["expires_in"])
+        # Concurrent requests all find the token expired at once, only the first refreshes it
+        async with self._token_lock:
+            if self.token_expires_at > datetime.now(tz=UTC):
+                return
+
+            auth_dict = {
+                "grant_type": "password",
+                "audience": self.audience,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "username": self.username,
+                "password": self.password,
+            }
+            timeout = timeout or self.session.timeout
+            async with self.session.post(self.auth_url, json=auth_dict, timeout=timeout) as response:
+                response.raise_for_status()
+                data = await response.json()
+                self.token = data["access_token"]
+                self.token_expires_at = datetime.now(tz=UTC) + timedelta(seconds=data["expires_in"])
 
-    async def make_request(
+    @asynccontextmanager
+    async def _request(  # noqa: PLR0913 -- the request's parts plus per-call timeout and retries
         self: Self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
-    ) -> dict:  # type: ignore[type-arg]
-        """Make a request to Dragonfly's API."""
-        await self._update_token()
+        headers: dict[str, str] | None = None,
+        timeout: ClientTimeout | None = None,
+        max_retries: int = 0,
+    ) -> AsyncIterator[ClientResponse]:
+        """
+        Send an authenticated request to Dragonfly's API and yield the response.
 
-        headers = {"Authorization": "Bearer " + self.token}
+        Server errors are retried up to `max_retries` times with exponential backoff.
+        `timeout` overrides the session's default timeout for each attempt.
+        """
+        # Bound the token refresh by the same timeout, it would otherwise wait on the session's much longer default
+        await self._update_token(timeout=timeout)
 
         args = {
             "url": self.base_url + path,
             "method": method,
-            "headers": headers,
+            "headers": {"Authorization": "Bearer " + self.token, **(headers or {})},
         }
 
         if params is not None:
@@ -126,15 +172,49 @@ class DragonflyServices:
         if json is not None:
             args["json"] = json
 
-        async with self.session.request(**args) as response:  # type: ignore[arg-type]
+        if timeout is not None:
+            args["timeout"] = timeout
+
+        attempt = 0
+        while True:
+            async with self._semaphore, self.session.request(**args) as response:  # type: ignore[arg-type]
+                if response.status < HTTPStatus.INTERNAL_SERVER_ERROR or attempt >= max_retries:
+                    yield response
+                    return
+
+            attempt += 1
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+    async def make_request(  # noqa: PLR0913 -- the request's parts plus per-call timeout and retries
+        self: Self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        *,
+        timeout: ClientTimeout | None = None,
+        max_retries: int = 0,
+    ) -> dict:  # type: ignore[type-arg]
+        """Make a request to Dragonfly's API."""
+        async with self._request(
+            method,
+            path,
+            params=params,
+            json=json,
+            timeout=timeout,
+            max_retries=max_retries,
+        ) as response:
             response.raise_for_status()
             return await response.json()  # type: ignore[no-any-return]
 
-    async def get_scanned_packages(
+    async def get_scanned_packages(  # noqa: PLR0913 -- filters plus per-call timeout and retries
         self: Self,
         name: str | None = None,
         version: str | None = None,
         since: datetime | None = None,
+        *,
+        timeout: ClientTimeout | None = None,
+        max_retries: int = 0,
     ) -> list[Package]:
         """Get a list of scanned packages."""
         params = {}
@@ -147,16 +227,52 @@ class DragonflyServices:
         if since:
             params["since"] = int(since.timestamp())  # type: ignore[assignment]
 
-        data = await self.make_request("GET", "/package", params=params)
-        return list(map(Package.model_validate, data))
+        # Revalidate previously seen lookups so that an unchanged result costs a 304 rather than a full body.
+        # Listings filtered by `since` aren't cached, callers move it forward every time so they'd never be hit again.
+        key = tuple(sorted(params.items())) if since is None else None
+        cached = self._package_cache.get(key) if key is not None else None
+        headers: dict[str, str] = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        async with self._request(
+            "GET",
+            "/package",
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            max_retries=max_retries,
+        ) as response:
+            if cached and response.status == HTTPStatus.NOT_MODIFIED:
+                return cached.packages
+
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        packages = _PACKAGE_LIST_ADAPTER.validate_json(body)
+        if key is not None and (etag or last_modified):
+            self._package_cache[key] = _CachedPackages(packages, etag, last_modified)
+
+        return packages
 
     async def report_package(
         self: Self,
         report: PackageReport,
+        *,
+        timeout: ClientTimeout | None = None,
     ) -> None:
-        """Report a package to Dragonfly."""
+        """
+        Report a package to Dragonfly.
+
+        Never retried, as a server error after the report was stored would file it a second time.
+        """
         data = dataclasses.asdict(report)
-        await self.make_request("POST", "/report", json=data)
+        await self.make_request("POST", "/report", json=data, timeout=timeout)
 
     async def queue_package(self: Self, name: str, version: str) -> None:
         """Add a package to the Dragonfly scan queue."""
@@ -25,23 +25,34 @@ class PaginatorView(ui.View):
     ) -> None:
         """Initialize the paginator view."""
         super().__init__(timeout=None)
-        pages = math.ceil(len(packages) / per)
         self.member = member
-        self.embeds = [
-            self._build_embed(packages[i : i + per], page, pages)
-            for page, i in enumerate(range(0, len(packages), per), start=1)
-        ]
+        self.packages = packages
+        self.per = per
+        self.pages = math.ceil(len(packages) / per)
         self.current = 0
 
+        # Pages are only built once they're first shown, most paginators never get past the first few
+        self._embeds: dict[int, discord.Embed] = {}
+
+    @property
+    def current_embed(self: Self) -> discord.Embed:
+        """The embed for the current page, built on first access."""
+        if (embed := self._embeds.get(self.current)) is None:
+            start = self.current * self.per
+            embed = self._build_embed(self.packages[start : start + self.per], self.current + 1, self.pages)
+            self._embeds[self.current] = embed
+
+        return embed
+
     @ui.button(emoji="◀️")
     async def previous(self: Self, interaction: discord.Interaction, _) -> None:  # type: ignore[no-untyped-def, type-arg] # noqa: ANN001 -- What is this?
         """Go to the previous page."""
         if self.current == 0:
-            self.current = len(self.embeds) - 1
+            self.current = self.pages - 1
         else:
             self.current -= 1
 
-        await interaction.response.edit_message(embed=self.embeds[self.current], view=self)
+        await interaction.response.edit_message(embed=self.current_embed)
 
     @ui.button(emoji="⏹️")
     async def stop(self: Self, interaction: discord.Interaction, button: ui.Button) -> None:  # type: ignore[override, type-arg]
@@ -50,17 +61,17 @@ class PaginatorView(ui.View):
         button.disabled = True
         self.next.disabled = True
 
-        await interaction.response.edit_message(embed=self.embeds[self.current], view=self)
+        await interaction.response.edit_message(embed=self.current_embed, view=self)
 
     @ui.button(emoji="▶️")
     async def next(self: Self, interaction: discord.Interaction, _) -> None:  # type: ignore[no-untyped-def, type-arg] # noqa: ANN001
         """Go to the next page."""
-        if self.current == len(self.embeds) - 1:
+        if self.current == self.pages - 1:
             self.current = 0
         else:
             self.current += 1
 
-        await interaction.response.edit_message(embed=self.embeds[self.current], view=self)
+        await interaction.response.edit_message(embed=self.current_embed)
 
     async def interaction_check(self: Self, interaction: discord.Interaction) -> bool:  # type: ignore[type-arg]
         """Check if the interaction is from the member."""
@@ -120,7 +131,7 @@ class Audit(commands.Cog):
         packages = random.sample(packages, k=amount)
 
         view = PaginatorView(member=interaction.user, packages=packages)
-        await interaction.followup.send(embed=view.embeds[0], view=view)
+        await interaction.followup.send(embed=view.current_embed, view=view)
 
 
 async def setup(bot: Bot) -> None:
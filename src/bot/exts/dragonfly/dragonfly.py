@@ -15,10 +15,19 @@ from bot import constants
 from bot.bot import Bot
 from bot.constants import Channels, DragonflyConfig, Roles
 from bot.dragonfly_services import DragonflyServices, Package, PackageReport
+from bot.utils.caching import TTLCache
 
 log = getLogger(__name__)
 log.setLevel(logging.INFO)
 
+# Calls made while an interaction is pending must fail well before Discord gives up on the response
+INTERACTION_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=2)
+INTERACTION_MAX_RETRIES = 1
+
+ALL_PACKAGES_SCANNED_MAX_LENGTH = 3900
+
+MAX_SCAN_INTERVAL_MULTIPLIER = 8
+
 
 def _build_modal_title(name: str, version: str) -> str:
     """Build the modal title."""
@@ -58,6 +67,9 @@ async def handle_submit(
     dragonfly_services: DragonflyServices,
 ) -> None:
     """Handle modal submit."""
+    # Defer immediately because reporting may take longer than the 3 seconds Discord waits for a response
+    await interaction.response.defer(ephemeral=True, thinking=True)
+
     log.info(
         "User %s reported package %s@%s with additional_information '%s' and inspector_url '%s'",
         interaction.user,
@@ -79,9 +91,9 @@ async def handle_submit(
 
         await log_channel.send(embed=embed)
 
-    await dragonfly_services.report_package(report)
+    await dragonfly_services.report_package(report, timeout=INTERACTION_TIMEOUT)
 
-    await interaction.response.send_message("Reported!", ephemeral=True)
+    await interaction.followup.send("Reported!", ephemeral=True)
 
 
 class ConfirmEmailReportModal(discord.ui.Modal):
@@ -129,9 +141,10 @@ class ConfirmEmailReportModal(discord.ui.Modal):
                 f"Retry using Observation API instead?"
             )
             view = ReportMethodSwitchConfirmationView(previous_modal=self)
-            return await interaction.response.send_message(message, view=view, ephemeral=True)
+            await interaction.followup.send(message, view=view, ephemeral=True)
+            return
 
-        await interaction.response.send_message("An unexpected error occurred.", ephemeral=True)
+        await interaction.followup.send("An unexpected error occurred.", ephemeral=True)
         raise error
 
     async def on_submit(self: Self, interaction: discord.Interaction) -> None:
@@ -182,9 +195,10 @@ class ConfirmReportModal(discord.ui.Modal):
         if isinstance(error, aiohttp.ClientResponseError):
             message = f"Error from upstream: {error.status}\n```{error.message}```\nRetry using email instead?"
             view = ReportMethodSwitchConfirmationView(previous_modal=self)
-            return await interaction.response.send_message(message, view=view, ephemeral=True)
+            await interaction.followup.send(message, view=view, ephemeral=True)
+            return
 
-        await interaction.response.send_message("An unexpected error occurred.", ephemeral=True)
+        await interaction.followup.send("An unexpected error occurred.", ephemeral=True)
         raise error
 
     async def on_submit(self: Self, interaction: discord.Interaction) -> None:
@@ -304,33 +318,57 @@ def _build_package_scan_result_embed(scan_result: Package) -> discord.Embed:
 
 def _build_all_packages_scanned_embed(scan_results: list[Package]) -> discord.Embed:
     """Build the embed that shows a list of all packages scanned."""
-    if scan_results:
-        description = "\n".join(map(str, scan_results))
-        return discord.Embed(description=f"```{description}```")
-    return discord.Embed(description="_No packages scanned_")
+    if not scan_results:
+        return discord.Embed(description="_No packages scanned_")
+
+    lines = [str(result) for result in scan_results]
+    description = "\n".join(lines)
 
+    # Embed descriptions are capped at 4096 characters, cut on a line boundary to leave room for the code block
+    if len(description) > ALL_PACKAGES_SCANNED_MAX_LENGTH:
+        shown = len(lines)
+        length = 0
+        for index, line in enumerate(lines):
+            length += len(line) + 1
+            if length > ALL_PACKAGES_SCANNED_MAX_LENGTH:
+                shown = index
+                break
 
-async def run(
+        description = "\n".join(lines[:shown]) + f"\n... ({len(lines) - shown} more)"
+
+    return discord.Embed(description=f"```{description}```")
+
+
+async def run(  # noqa: PLR0913 -- the alerted cache lives on the cog, so it's passed in with the channels
     bot: Bot,
     *,
     since: datetime,
     alerts_channel: discord.abc.Messageable,
     logs_channel: discord.abc.Messageable,
     score: int,
-) -> None:
-    """Script entrypoint."""
+    alerted: TTLCache[tuple[str, str], bool],
+) -> list[Package]:
+    """Script entrypoint. Returns the packages scanned since `since`."""
     scan_results = await bot.dragonfly_services.get_scanned_packages(since=since)
     for result in scan_results:
         if result.score is not None and result.score >= score:
+            # The backend may re-emit a package when it is rescored, don't ping for it twice
+            key = (result.name, result.version)
+            if key in alerted:
+                continue
+
             embed = _build_package_scan_result_embed(result)
             await alerts_channel.send(
                 f"<@&{DragonflyConfig.alerts_role_id}>",
                 embed=embed,
                 view=ReportView(bot, result),
             )
+            alerted[key] = True
 
     await logs_channel.send(embed=_build_all_packages_scanned_embed(scan_results))
 
+    return scan_results
+
 
 class Dragonfly(commands.Cog):
     """Cog for the Dragonfly scanner."""
@@ -340,12 +378,18 @@ class Dragonfly(commands.Cog):
         self.bot = bot
         self.score_threshold = DragonflyConfig.threshold
         self.since = datetime.now(tz=UTC) - timedelta(seconds=DragonflyConfig.interval)
+        self.scan_interval = DragonflyConfig.interval
+        self._alerted: TTLCache[tuple[str, str], bool] = TTLCache(maxsize=2048, ttl=24 * 60 * 60)
+        self._reported_errors: TTLCache[tuple[str, str], bool] = TTLCache(maxsize=64, ttl=5 * 60)
         super().__init__()
 
     @commands.hybrid_command(name="username")  # type: ignore [arg-type]
     async def get_username_command(self, ctx: commands.Context[Bot]) -> None:
         """Get the username of the currently logged in user to the PyPI Observation API."""
-        async with ctx.bot.http_session.get(DragonflyConfig.reporter_url + "/echo") as res:
+        # Defer first when invoked as a slash command, the request may take longer than 3 seconds
+        await ctx.defer()
+
+        async with ctx.bot.http_session.get(DragonflyConfig.reporter_url + "/echo", timeout=INTERACTION_TIMEOUT) as res:
             json = await res.json()
             username = json["username"]
 
@@ -360,19 +404,44 @@ class Dragonfly(commands.Cog):
         alerts_channel = self.bot.get_channel(DragonflyConfig.alerts_channel_id)
         assert isinstance(alerts_channel, discord.abc.Messageable)
 
+        # Taken before the request so packages finishing while this run is in flight are picked up next time
+        now = datetime.now(tz=UTC)
         try:
-            await run(
+            scan_results = await run(
                 self.bot,
                 since=self.since,
                 logs_channel=logs_channel,
                 alerts_channel=alerts_channel,
                 score=self.score_threshold,
+                alerted=self._alerted,
             )
         except Exception as e:
+            # The loop has no error handler, an error escaping it would stop the loop for good
             log.exception("An error occurred in the scan loop task. Skipping run.")
-            sentry_sdk.capture_exception(e)
+            self._capture_error(e)
         else:
-            self.since = datetime.now(tz=UTC)
+            self.since = now
+            self._update_scan_interval(has_results=bool(scan_results))
+
+    def _capture_error(self: Self, error: Exception) -> None:
+        """Report `error` to Sentry, unless the same error was reported recently."""
+        # A flaky backend fails the same way every interval, only report each distinct error once in a while
+        key = (type(error).__name__, str(error)[:80])
+        if key not in self._reported_errors:
+            self._reported_errors[key] = True
+            sentry_sdk.capture_exception(error)
+
+    def _update_scan_interval(self: Self, *, has_results: bool) -> None:
+        """Back off polling exponentially while no packages are being scanned, reset as soon as there are."""
+        if has_results:
+            interval = DragonflyConfig.interval
+        else:
+            interval = min(self.scan_interval * 2, DragonflyConfig.interval * MAX_SCAN_INTERVAL_MULTIPLIER)
+
+        if interval != self.scan_interval:
+            log.debug("Changing scan loop interval from %ss to %ss", self.scan_interval, interval)
+            self.scan_interval = interval
+            self.scan_loop.change_interval(seconds=interval)
 
     @scan_loop.before_loop
     async def before_scan_loop(self: Self) -> None:
@@ -435,13 +504,28 @@ class Dragonfly(commands.Cog):
     @discord.app_commands.command(name="lookup", description="Scans a package")
     async def lookup(self: Self, interaction: discord.Interaction, name: str, version: str | None = None) -> None:  # type: ignore[type-arg]
         """Pull the scan results for a package."""
-        scan_results = await self.bot.dragonfly_services.get_scanned_packages(name=name, version=version)
+        # Defer immediately because the upstream call, including a retry, may take longer than 3 seconds
+        await interaction.response.defer(thinking=True)
+
+        try:
+            scan_results = await self.bot.dragonfly_services.get_scanned_packages(
+                name=name,
+                version=version,
+                timeout=INTERACTION_TIMEOUT,
+                max_retries=INTERACTION_MAX_RETRIES,
+            )
+        except (aiohttp.ClientError, TimeoutError):
+            # Answer the deferred interaction, otherwise the user is left looking at "thinking..." until it expires
+            log.exception("Failed to look up %s %s", name, version)
+            await interaction.followup.send("Failed to fetch the scan results from Dragonfly, try again later.")
+            return
+
         if scan_results:
             package = scan_results[0]
             embed = _build_package_scan_result_embed(package)
-            await interaction.response.send_message(embed=embed, view=ReportView(self.bot, package))
+            await interaction.followup.send(embed=embed, view=ReportView(self.bot, package))
         else:
-            await interaction.response.send_message("No entries were found with the specified filters.")
+            await interaction.followup.send("No entries were found with the specified filters.")
 
     @commands.group()
     async def threshold(self: Self, ctx: commands.Context) -> None:  # type: ignore[type-arg]
@@ -1,10 +1,12 @@
 """Threat Intelligence Feed Cog."""
 
+import asyncio
 import json
 import logging
 import re
-from io import BytesIO
+from http import HTTPStatus
 from logging import getLogger
+from tempfile import SpooledTemporaryFile
 from typing import Any
 from zipfile import ZipFile
 
@@ -19,7 +21,14 @@ from bot.dragonfly_services import Package
 log = getLogger(__name__)
 log.setLevel(logging.INFO)
 
-_p = re.compile(r"https://inspector.pypi.io/project/(?P<name>\w+)/(?P<version>[\w.]+)/.*")
+# Zipballs larger than this are spooled to disk rather than held in memory
+ZIPBALL_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+ZIPBALL_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of new reports looked up and posted at the same time
+REPORT_CONCURRENCY = 5
+
+_p = re.compile(r"https://inspector\.pypi\.io/project/(?P<name>[^/]+)/(?P<version>[^/]+)/")
 
 
 def build_github_link_from_path(path: str) -> str:
@@ -42,17 +51,33 @@ def parse_package_info_from_inspector_url(inspector_url: str) -> tuple[str, str]
 
 
 def search(d: dict, key: Any) -> Any | None:  # noqa: ANN401 - we can't know the type of the dict ahead of time
-    """Recursively search for the first occurrence of a key in a dict. None if not found."""
-    for k, v in d.items():
-        if k == key:
-            return v
-
-        if isinstance(v, dict) and (val := search(v, key)):
-            return val
+    """Search a dict and its nested dicts depth-first, in key order, for the first value of a key. None if not found."""
+    # A stack of item iterators, so that each nested dict is resumed where it was left off
+    stack = [iter(d.items())]
+    while stack:
+        for k, v in stack[-1]:
+            if k == key:
+                # Like a recursive search, an empty value in a nested dict ends that dict's search and moves on
+                if v or len(stack) == 1:
+                    return v
+
+                stack.pop()
+                break
+
+            if isinstance(v, dict):
+                stack.append(iter(v.items()))
+                break
+        else:
+            stack.pop()
 
     return None
 
 
+def read_report(zipfile: ZipFile, path: str) -> Any:  # noqa: ANN401 - reports are arbitrary JSON
+    """Inflate and decode the JSON report at `path` in the zipfile. Blocking, run it in a worker thread."""
+    return json.loads(zipfile.read(path))
+
+
 def build_embed(package: Package, path: str, inspector_url: str) -> discord.Embed:
     """Return the embed to be sent in the threat intelligence feed."""
     if package.reported_at:
@@ -89,17 +114,44 @@ def build_package_not_found_embed(name: str, version: str, path: str) -> discord
     )
 
 
-async def fetch_zipfile(http_client: aiohttp.ClientSession) -> ZipFile:
-    """Download the source zipfile from GitHub for the feed source repository."""
+async def fetch_zipfile(
+    http_client: aiohttp.ClientSession,
+    *,
+    etag: str | None = None,
+) -> tuple[ZipFile | None, str | None]:
+    """
+    Download the source zipfile from GitHub for the feed source repository.
+
+    If `etag` is given, the download is conditional on the repository having changed since.
+    Return a tuple of the zipfile, or None if it hasn't changed, and the ETag to pass in next time.
+    The caller must close both the zipfile and the spooled file it reads from, `zipfile.fp`.
+    """
     url = f"https://api.github.com/repos/{constants.ThreatIntelFeed.repository}/zipball"
     headers = {"Authorization": f"Bearer {constants.ThreatIntelFeed.access_token}"}
+    if etag:
+        headers["If-None-Match"] = etag
 
-    async with http_client.get(url, headers=headers) as res:
-        res.raise_for_status()
-        b = await res.content.read()
+    # Stream the body instead of buffering it whole, so it never sits in memory twice
+    spool = SpooledTemporaryFile(max_size=ZIPBALL_SPOOL_MAX_SIZE)  # noqa: SIM115 -- closed by the caller
+    try:
+        async with http_client.get(url, headers=headers) as res:
+            if res.status == HTTPStatus.NOT_MODIFIED:
+                spool.close()
+                return None, etag
 
-        buffer = BytesIO(b)
-        return ZipFile(buffer)
+            res.raise_for_status()
+            etag = res.headers.get("ETag")
+
+            async for chunk in res.content.iter_chunked(ZIPBALL_CHUNK_SIZE):
+                # Writes block on disk I/O once the spool has rolled over, keep them off the event loop
+                await asyncio.to_thread(spool.write, chunk)
+
+        spool.seek(0)
+        # Parsing the central directory is blocking I/O too
+        return await asyncio.to_thread(ZipFile, spool), etag
+    except BaseException:
+        spool.close()
+        raise
 
 
 class ThreatIntelFeed(commands.Cog):
@@ -108,48 +160,78 @@ class ThreatIntelFeed(commands.Cog):
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
         self.reports_seen: set[str] = set()
+        self._etag: str | None = None
+
+    async def _process_report(self, zipfile: ZipFile, path: str, channel: discord.abc.Messageable) -> None:
+        """Look up the package a report was filed for and post the result to `channel`."""
+        content = await asyncio.to_thread(read_report, zipfile, path)
+        inspector_url: str | None = search(content, "inspector_url")
+        if not inspector_url:
+            log.error("Inspector URL not found in %s, skipping", path)
+            return
+
+        match parse_package_info_from_inspector_url(inspector_url):
+            case name, version:
+                results = await self.bot.dragonfly_services.get_scanned_packages(name=name, version=version)
+                package = results[0] if results else None
+
+                if package:
+                    embed = build_embed(package, path, inspector_url)
+                else:
+                    embed = build_package_not_found_embed(name, version, path)
+
+                await channel.send(embed=embed)
+
+            case None:
+                log.error('Unable to parse inspector URL: "%s" in %s, skipping', inspector_url, path)
 
     @tasks.loop(seconds=constants.ThreatIntelFeed.interval)
     async def watcher(self) -> None:
         """Watch the GitHub repository for changes."""
-        zipfile = await fetch_zipfile(self.bot.http_session)
-        paths = {path for path in zipfile.namelist() if path.endswith(".json")}
-
         channel = self.bot.get_channel(constants.ThreatIntelFeed.channel_id)
         if not isinstance(channel, discord.abc.Messageable):
             log.error("Threat intel feed channel is not messageable")
             return
 
+        zipfile, etag = await fetch_zipfile(self.bot.http_session, etag=self._etag)
+        if zipfile is None:
+            log.debug("Threat intel feed repository unchanged, skipping")
+            return
+
+        # A ZipFile doesn't close a file object it was handed, so close the spooled zipball along with it
+        with zipfile.fp, zipfile:  # type: ignore[union-attr]
+            await self._process_zipfile(zipfile, etag, channel)
+
+    async def _process_zipfile(self, zipfile: ZipFile, etag: str | None, channel: discord.abc.Messageable) -> None:
+        """Post every report in `zipfile` which hasn't been seen yet to `channel`."""
+        paths = {path for path in zipfile.namelist() if path.endswith(".json")}
+
         # The first time around, just add all the reports to our "seen reports" set
         if len(self.reports_seen) == 0:
             self.reports_seen |= paths
+            self._etag = etag
             return
 
-        for path in paths:
-            if path in self.reports_seen:
-                continue
-
-            content = json.loads(zipfile.read(path).decode())
-            inspector_url: str | None = search(content, "inspector_url")
-            if not inspector_url:
-                log.error("Inspector URL not found in %s, skipping", path)
-                continue
+        semaphore = asyncio.Semaphore(REPORT_CONCURRENCY)
 
-            match parse_package_info_from_inspector_url(inspector_url):
-                case name, version:
-                    results = await self.bot.dragonfly_services.get_scanned_packages(name=name, version=version)
-                    package = results[0] if results else None
+        async def process(path: str) -> bool:
+            async with semaphore:
+                try:
+                    await self._process_report(zipfile, path, channel)
+                except Exception:
+                    # One bad report mustn't stop the others or the loop
+                    log.exception("Failed to process report %s, retrying next run", path)
+                    return False
 
-                    if package:
-                        embed = build_embed(package, path, inspector_url)
-                    else:
-                        embed = build_package_not_found_embed(name, version, path)
+            # Remember each report as soon as it's posted, so it isn't posted again if another one fails
+            self.reports_seen.add(path)
+            return True
 
-                    await channel.send(embed=embed)
+        results = await asyncio.gather(*(process(path) for path in paths - self.reports_seen))
 
-                case None:
-                    log.error('Unable to parse inspector URL: "%s" in %s, skipping', inspector_url, path)
-                    continue
+        # Only skip an unchanged zipball next time if every new report made it, otherwise the failures are retried
+        if all(results):
+            self._etag = etag
 
     @watcher.before_loop
     async def before_watcher(self) -> None:
@@ -1,11 +1,15 @@
 """Internal commands for bot administration and core development."""
 
+import ast
 import contextlib
+import copy
+import functools
 import inspect
 import pprint
 import re
 import textwrap
 import traceback
+import types
 from collections import Counter
 from io import StringIO
 from typing import Any, Self
@@ -26,6 +30,38 @@ from bot.utils import (
 
 log = get_logger(__name__)
 
+# Statements which can't be evaluated as an expression and so mustn't be assigned to `_`
+_STMT_RE = re.compile(r"return|import|for|while|def|class|from|exit|[a-zA-Z0-9]+\s*=")
+
+# The REPL wrapper that evaluated code is injected into, parsed once rather than on every eval
+_EVAL_WRAPPER = ast.parse(
+    textwrap.dedent(
+        """
+        async def func():  # (None,) -> Any
+            try:
+                with contextlib.redirect_stdout(self.stdout):
+                    pass  # Replaced by the evaluated code
+                if '_' in locals():
+                    if inspect.isawaitable(_):
+                        _ = await _
+                    return _
+            finally:
+                self.env.update(locals())
+        """,
+    ),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_eval(code: str) -> types.CodeType:
+    """Compile `code` as the body of the REPL wrapper function. Raise `SyntaxError` if `code` is invalid."""
+    wrapper = copy.deepcopy(_EVAL_WRAPPER)
+    redirect_block: ast.With = wrapper.body[0].body[0].body[0]  # type: ignore[attr-defined]
+    # Code that is only comments parses to an empty body, which isn't a valid block
+    redirect_block.body = ast.parse(code, filename="<eval>").body or [ast.copy_location(ast.Pass(), redirect_block)]
+
+    return compile(wrapper, "<eval>", "exec")
+
 
 class Internal(Cog):
     """Administrator and Core Developer commands."""
@@ -38,7 +74,7 @@ class Internal(Cog):
 
         self.socket_since = arrow.utcnow()
         self.socket_event_total = 0
-        self.socket_events = Counter()  # type: ignore[var-annotated]
+        self.socket_events: dict[str, int] = {}
 
         if DEBUG_MODE:
             self.eval.add_check(is_owner().predicate)
@@ -47,24 +83,25 @@ class Internal(Cog):
     async def on_socket_event_type(self: Self, event_type: str) -> None:
         """When a websocket event is received, increase our counters."""
         self.socket_event_total += 1
-        self.socket_events[event_type] += 1
+        # This runs for every gateway event, and subscripting a plain dict takes the interpreter's exact-dict fast path
+        # where a Counter, as a dict subclass, doesn't. The events are only ranked when socketstats asks for them.
+        self.socket_events[event_type] = self.socket_events.get(event_type, 0) + 1
 
     def _format(self: Self, inp: str, out: Any) -> tuple[str, discord.Embed | None]:  # noqa: ANN401,C901,PLR0912
         """Format the eval output into a string & attempt to format it into an Embed."""
         self._ = out
 
-        res = ""
-
         # Erase temp input we made
         if inp.startswith("_ = "):
             inp = inp[4:]
 
         # Get all non-empty lines
-        lines = [line for line in inp.split("\n") if line.strip()]
+        lines = [line for line in inp.splitlines() if line.strip()]
         if len(lines) != 1:
-            lines += [""]
+            lines.append("")
 
         # Create the input dialog
+        parts: list[str] = []
         for i, line in enumerate(lines):
             if i == 0:  # noqa: SIM108 -- ternary would strip the comment
                 # Start dialog
@@ -93,12 +130,14 @@ class Internal(Cog):
                 line = line[6:].strip()  # noqa: PLW2901
 
             # Combine everything
-            res += start + line + "\n"
+            parts += (start, line, "\n")
+
+        res = "".join(parts)
 
+        # Reuse the buffer instead of replacing it, the eval wrapper redirects stdout to whatever it holds
+        text = self.stdout.getvalue()
+        self.stdout.truncate(0)
         self.stdout.seek(0)
-        text = self.stdout.read()
-        self.stdout.close()
-        self.stdout = StringIO()
 
         if text:
             res += text + "\n"
@@ -165,24 +204,8 @@ class Internal(Cog):
 
         self.env.update(env)
 
-        # Ignore this code, it works
-        code_ = """
-async def func():  # (None,) -> Any
-    try:
-        with contextlib.redirect_stdout(self.stdout):
-{}
-        if '_' in locals():
-            if inspect.isawaitable(_):
-                _ = await _
-            return _
-    finally:
-        self.env.update(locals())
-""".format(
-            textwrap.indent(code, "            "),
-        )
-
         try:
-            exec(code_, self.env)  # noqa: S102
+            exec(_compile_eval(code), self.env)  # noqa: S102
             func = self.env["func"]
             res = await func()
 
@@ -228,17 +251,10 @@ async def func():  # (None,) -> Any
     async def eval(self: Self, ctx: Context, *, code: str) -> None:  # type: ignore[type-arg]
         """Run eval in a REPL-like format."""
         code = code.strip("`")
-        if re.match("py(thon)?\n", code):
-            code = "\n".join(code.split("\n")[1:])
-
-        if (
-            not re.search(  # Check if it's an expression
-                r"^(return|import|for|while|def|class|from|exit|[a-zA-Z0-9]+\s*=)",
-                code,
-                re.MULTILINE,
-            )
-            and len(code.split("\n")) == 1
-        ):
+        if code.startswith(("py\n", "python\n")):  # Drop the code block's language tag
+            code = code.split("\n", 1)[1]
+
+        if "\n" not in code and not _STMT_RE.match(code):  # Check if it's an expression
             code = "_ = " + code
 
         await self._eval(ctx, code)
@@ -257,7 +273,7 @@ async def func():  # (None,) -> Any
             color=discord.Color.og_blurple(),
         )
 
-        for event_type, count in self.socket_events.most_common(25):
+        for event_type, count in Counter(self.socket_events).most_common(25):
             stats_embed.add_field(name=event_type, value=f"{count:,}", inline=True)
 
         await ctx.send(embed=stats_embed)
@@ -22,7 +22,7 @@ LoggerClass = Logger if TYPE_CHECKING else logging.getLoggerClass()
 class CustomLogger(LoggerClass):  # type: ignore[misc, valid-type]
     """Custom implementation of the `Logger` class with an added `trace` method."""
 
-    def trace(self: Self, msg: str, *args: tuple, **kwargs: dict) -> None:  # type: ignore[type-arg]
+    def trace(self: Self, msg: str, *args: object, **kwargs: dict) -> None:  # type: ignore[type-arg]
         """
         Log 'msg % args' with severity 'TRACE'.
 
@@ -0,0 +1,62 @@
+"""Caching utilities."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, Self, TypeVar
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+class TTLCache(Generic[KT, VT]):
+    """
+    A size-bounded mapping whose entries expire `ttl` seconds after they were set.
+
+    When more than `maxsize` entries are stored, the oldest entries are evicted first.
+    """
+
+    def __init__(self: Self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+
+    def _expire(self: Self) -> None:
+        """Drop all entries whose time to live has elapsed."""
+        now = time.monotonic()
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+
+    def __contains__(self: Self, key: object) -> bool:
+        """Return True if `key` is present and has not expired."""
+        self._expire()
+        return key in self._data
+
+    def __getitem__(self: Self, key: KT) -> VT:
+        """Return the value for `key`, raising `KeyError` if it is missing or expired."""
+        self._expire()
+        return self._data[key][1]
+
+    def __setitem__(self: Self, key: KT, value: VT) -> None:
+        """Set `key` to `value`, resetting its time to live."""
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+        self._expire()
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self: Self) -> int:
+        """Return the number of entries which have not expired."""
+        self._expire()
+        return len(self._data)
+
+    def get(self: Self, key: KT, default: VT | None = None) -> VT | None:
+        """Return the value for `key` if present and not expired, else `default`."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
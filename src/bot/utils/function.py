@@ -79,13 +79,19 @@ def get_arg_value_wrapper(
     return decorator_func(wrapper)
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_signature(func: Callable) -> inspect.Signature:  # type: ignore[type-arg]
+    """Return the signature of `func`, cached as signatures are immutable and costly to build on every call."""
+    return inspect.signature(func)
+
+
 def get_bound_args(func: Callable, args: tuple, kwargs: dict[str, Any]) -> BoundArgs:  # type: ignore[type-arg]
     """
     Bind `args` and `kwargs` to `func` and return a mapping of parameter names to argument values.
 
     Default parameter values are also set.
     """
-    sig = inspect.signature(func)
+    sig = _get_signature(func)
     bound_args = sig.bind(*args, **kwargs)
     bound_args.apply_defaults()
 
@@ -115,8 +121,9 @@ def update_wrapper_globals(
     annotation_global_names = (
         ann.split(".", maxsplit=1)[0] for ann in wrapped.__annotations__.values() if isinstance(ann, str)
     )
+    wrapper_names = frozenset(wrapper.__code__.co_names)
     # Conflicting globals from both functions' modules that are also used in the wrapper and in wrapped's annotations.
-    shared_globals = set(wrapper.__code__.co_names) & set(annotation_global_names)
+    shared_globals = wrapper_names & set(annotation_global_names)
     shared_globals &= set(wrapped.__globals__) & set(wrapper.__globals__) - ignored_conflict_names
     if shared_globals:
         msg = (
@@ -126,7 +133,7 @@ def update_wrapper_globals(
         raise GlobalNameConflictError(msg)
 
     new_globals = wrapper.__globals__.copy()
-    new_globals.update((k, v) for k, v in wrapped.__globals__.items() if k not in wrapper.__code__.co_names)
+    new_globals.update((k, v) for k, v in wrapped.__globals__.items() if k not in wrapper_names)
     return types.FunctionType(
         code=wrapper.__code__,
         globals=new_globals,
@@ -12,7 +12,7 @@ class CogABCMeta(CogMeta, ABCMeta):
 
 def find_nth_occurrence(string: str, substring: str, n: int) -> int | None:
     """Return index of `n`th occurrence of `substring` in `string`, or None if not found."""
-    index = 0
+    index = -1
     for _ in range(n):
         index = string.find(substring, index + 1)
         if index == -1:
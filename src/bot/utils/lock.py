@@ -82,22 +82,22 @@ def lock(
 
         @command_wraps(func)  # type: ignore[arg-type]
         async def wrapper(*args: tuple, **kwargs: dict) -> Any:  # type: ignore[type-arg] # noqa: ANN401 -- matches signature of upstream
-            log.trace(f"{name}: mutually exclusive decorator called")
+            log.trace("%s: mutually exclusive decorator called", name)
 
             if callable(resource_id):
-                log.trace(f"{name}: binding args to signature")
+                log.trace("%s: binding args to signature", name)
                 bound_args = function.get_bound_args(func, args, kwargs)
 
-                log.trace(f"{name}: calling the given callable to get the resource ID")
+                log.trace("%s: calling the given callable to get the resource ID", name)
                 id_ = resource_id(bound_args)
 
                 if inspect.isawaitable(id_):
-                    log.trace(f"{name}: awaiting to get resource ID")
+                    log.trace("%s: awaiting to get resource ID", name)
                     id_ = await id_
             else:
                 id_ = resource_id
 
-            log.trace(f"{name}: getting the lock object for resource {namespace!r}:{id_!r}")
+            log.trace("%s: getting the lock object for resource %r:%r", name, namespace, id_)
 
             # Get the lock for the ID. Create a lock if one doesn't exist yet.
             locks = __lock_dicts[namespace]
@@ -108,11 +108,11 @@ def lock(
             #   2. `asyncio.Lock.acquire()` does not internally await anything if the lock is free
             #   3. awaits only yield execution to the event loop at actual I/O boundaries
             if wait or not lock_.locked():
-                log.debug(f"{name}: acquiring lock for resource {namespace!r}:{id_!r}...")
+                log.debug("%s: acquiring lock for resource %r:%r...", name, namespace, id_)
                 async with lock_:
                     return await func(*args, **kwargs)
             else:
-                log.info(f"{name}: aborted because resource {namespace!r}:{id_!r} is locked")
+                log.info("%s: aborted because resource %r:%r is locked", name, namespace, id_)
                 if raise_error:
                     raise LockedResourceError(str(namespace), id_)  # type: ignore[arg-type]
                 return None
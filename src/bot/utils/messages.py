@@ -13,7 +13,7 @@ def format_user(user: discord.abc.User) -> str:
     return f"{user.mention} (`{user.id}`)"
 
 
-async def get_discord_message(ctx: Context, text: str) -> Message | str:  # type: ignore[return, type-arg]
+async def get_discord_message(ctx: Context, text: str) -> Message | str:  # type: ignore[type-arg]
     """
     Attempt to convert a given `text` to a discord Message object and return it.
 
@@ -23,6 +23,8 @@ async def get_discord_message(ctx: Context, text: str) -> Message | str:  # type
     with contextlib.suppress(commands.BadArgument):
         return await MessageConverter().convert(ctx, text)
 
+    return text
+
 
 async def get_text_and_embed(ctx: Context, text: str) -> tuple[str, Embed | None]:  # type: ignore[type-arg]
     """
@@ -1,5 +1,8 @@
 """Service utilities for the bot."""
 
+import asyncio
+import random
+
 from aiohttp import ClientConnectorError, ClientSession
 
 from bot.constants import URLs
@@ -8,6 +11,9 @@ from bot.log import get_logger
 log = get_logger(__name__)
 
 FAILED_REQUEST_ATTEMPTS = 3
+# Delay in seconds before the first retry, doubled for each one after, up to the maximum
+BASE_BACKOFF = 0.1
+MAX_BACKOFF = 2.0
 MAX_PASTE_LENGTH = 100_000
 
 
@@ -19,6 +25,16 @@ class PasteTooLongError(Exception):
     """Raised when content is too large to upload to the paste service."""
 
 
+def _retry_delay(attempt: int) -> float:
+    """Return how long to wait before the given attempt, backing off exponentially after the first."""
+    if attempt == 1:
+        return 0
+
+    # Jitter the delay so concurrent uploads don't retry in lockstep
+    delay = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** (attempt - 2))
+    return delay + random.random() * BASE_BACKOFF / 2  # noqa: S311 -- not cryptographic
+
+
 async def send_to_paste_service(
     http_session: ClientSession,
     contents: str,
@@ -29,6 +45,8 @@ async def send_to_paste_service(
     """
     Upload `contents` to the paste service.
 
+    `http_session` should be the bot's long-lived session, so uploads reuse its pooled keep-alive connections.
+
     Add `extension` to the output URL. Use `max_length` to limit the allowed contents length
     to lower than the maximum allowed by the paste service.
 
@@ -43,39 +61,50 @@ async def send_to_paste_service(
 
     extension = extension and f".{extension}"
 
-    contents_size = len(contents.encode())
+    # UTF-8 takes 1 to 4 bytes per character, so only encode to measure the size when the length is inconclusive
+    contents_size = len(contents)
+    if contents_size <= max_length < contents_size * 4:
+        contents_size = len(contents.encode())
+
     if contents_size > max_length:
         log.info("Contents too large to send to paste service.")
         msg = f"Contents of size {contents_size} greater than maximum size {max_length}"
         raise PasteTooLongError(msg)
 
-    log.debug(f"Sending contents of size {contents_size} bytes to paste service.")
+    log.debug("Sending contents of size %d to paste service.", contents_size)
     paste_url = URLs.paste_service.format(key="documents")
     for attempt in range(1, FAILED_REQUEST_ATTEMPTS + 1):
+        await asyncio.sleep(_retry_delay(attempt))
         try:
             async with http_session.post(paste_url, data=contents) as response:
                 response_json = await response.json()
         except ClientConnectorError:
             log.warning(
-                f"Failed to connect to paste service at url {paste_url}, "
-                f"trying again ({attempt}/{FAILED_REQUEST_ATTEMPTS}).",
+                "Failed to connect to paste service at url %s, trying again (%d/%d).",
+                paste_url,
+                attempt,
+                FAILED_REQUEST_ATTEMPTS,
             )
             continue
         except Exception:
             log.exception(
-                f"An unexpected error has occurred during handling of the request, "
-                f"trying again ({attempt}/{FAILED_REQUEST_ATTEMPTS}).",
+                "An unexpected error has occurred during handling of the request, trying again (%d/%d).",
+                attempt,
+                FAILED_REQUEST_ATTEMPTS,
             )
             continue
 
         if "message" in response_json:
             log.warning(
-                f"Paste service returned error {response_json['message']} with status code {response.status}, "
-                f"trying again ({attempt}/{FAILED_REQUEST_ATTEMPTS}).",
+                "Paste service returned error %s with status code %d, trying again (%d/%d).",
+                response_json["message"],
+                response.status,
+                attempt,
+                FAILED_REQUEST_ATTEMPTS,
             )
             continue
         if "key" in response_json:
-            log.info(f"Successfully uploaded contents to paste service behind key {response_json['key']}.")
+            log.info("Successfully uploaded contents to paste service behind key %s.", response_json["key"])
 
             paste_link = URLs.paste_service.format(key=response_json["key"]) + extension
 
@@ -85,8 +114,10 @@ async def send_to_paste_service(
             return paste_link + "?noredirect"
 
         log.warning(
-            f"Got unexpected JSON response from paste service: {response_json}\n"
-            f"trying again ({attempt}/{FAILED_REQUEST_ATTEMPTS}).",
+            "Got unexpected JSON response from paste service: %s\ntrying again (%d/%d).",
+            response_json,
+            attempt,
+            FAILED_REQUEST_ATTEMPTS,
         )
 
     msg = "Failed to upload contents to paste service"
@@ -0,0 +1,113 @@
+"""Tests for the caching utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from bot.utils import caching
+from bot.utils.caching import TTLCache
+
+TTL = 10
+
+
+class FakeClock:
+    """A monotonic clock which only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock used by the cache with one controlled by the test."""
+    fake = FakeClock()
+    monkeypatch.setattr(caching.time, "monotonic", fake)
+    return fake
+
+
+@pytest.mark.usefixtures("clock")
+def test_set_and_get() -> None:
+    """Stored values are returned until they expire."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=4, ttl=TTL)
+    cache["a"] = "first"
+
+    assert "a" in cache
+    assert cache["a"] == "first"
+    assert cache.get("a") == "first"
+    assert len(cache) == 1
+
+
+@pytest.mark.usefixtures("clock")
+def test_missing_key() -> None:
+    """Missing keys raise KeyError on subscription and return the default from get."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=4, ttl=TTL)
+
+    assert "a" not in cache
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+
+
+def test_entries_expire(clock: FakeClock) -> None:
+    """Entries disappear once their time to live has elapsed."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=4, ttl=TTL)
+    cache["a"] = "first"
+
+    clock.now = TTL - 0.1
+    assert cache.get("a") == "first"
+
+    clock.now = TTL
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_expiry_follows_insertion_order(clock: FakeClock) -> None:
+    """Each entry expires `ttl` seconds after it was set, independently of the others."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=4, ttl=TTL)
+    cache["a"] = "first"
+    clock.now = TTL / 2
+    cache["b"] = "second"
+
+    clock.now = TTL
+    assert "a" not in cache
+    assert cache["b"] == "second"
+
+    clock.now = TTL * 1.5
+    assert len(cache) == 0
+
+
+def test_setting_resets_ttl(clock: FakeClock) -> None:
+    """Setting an existing key restarts its time to live and makes it the newest entry."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=4, ttl=TTL)
+    cache["a"] = "first"
+    cache["b"] = "second"
+
+    clock.now = TTL / 2
+    cache["a"] = "updated"
+
+    clock.now = TTL
+    assert "b" not in cache
+    assert cache["a"] == "updated"
+
+
+@pytest.mark.usefixtures("clock")
+def test_oldest_entries_are_evicted() -> None:
+    """Once the cache is over its maxsize, the least recently set entries are dropped first."""
+    cache: TTLCache[str, str] = TTLCache(maxsize=2, ttl=TTL)
+    cache["a"] = "first"
+    cache["b"] = "second"
+    cache["a"] = "updated"
+    cache["c"] = "third"
+
+    assert "b" not in cache
+    assert cache["a"] == "updated"
+    assert cache["c"] == "third"
+    assert len(cache) == cache.maxsize